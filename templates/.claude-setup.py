@@ -12,10 +12,32 @@ Usage:
 import os
 import sys
 import shutil
-import stat
+import subprocess
 from pathlib import Path
 
 
+def _fast_copytree(src, dst):
+    """Copy a directory tree using the fastest mechanism available.
+
+    On Windows, shells out to robocopy (multi-threaded, much faster than
+    shutil.copytree for trees of many small files). Elsewhere, uses
+    shutil.copytree with plain copy (content + permissions, skipping the
+    per-file copystat metadata calls).
+    """
+    if sys.platform == 'win32' and shutil.which('robocopy'):
+        result = subprocess.run(
+            ['robocopy', str(src), str(dst),
+             '/MT:64', '/E', '/NFL', '/NDL', '/NJH', '/NJS', '/SL'],
+            check=False
+        )
+        # robocopy returns 0 (nothing copied) or 1 (files copied) on success
+        if result.returncode <= 1:
+            return
+        raise OSError(f"robocopy failed with exit code {result.returncode}")
+
+    shutil.copytree(src, dst, copy_function=shutil.copy)
+
+
 def print_header(text):
     """Print a formatted header."""
     print()
@@ -85,16 +107,16 @@ def copy_templates():
     # Copy templates
     try:
         print(f"Copying {template_dir} → {target_dir}")
-        shutil.copytree(template_dir, target_dir)
+        _fast_copytree(template_dir, target_dir)
         print("✅ Templates copied successfully")
         print()
 
-        # List what was copied
+        # List what was copied (os.walk reuses readdir's cached entry type,
+        # avoiding the per-entry stat() that rglob + is_file() would issue)
         print("Created:")
-        for item in sorted(target_dir.rglob("*")):
-            if item.is_file():
-                rel_path = item.relative_to(Path.cwd())
-                print(f"  {rel_path}")
+        for root, _, files in os.walk(target_dir):
+            for name in sorted(files):
+                print(f"  {os.path.relpath(os.path.join(root, name))}")
         print()
 
         return True
@@ -116,17 +138,19 @@ def make_hooks_executable():
         print()
         return True
 
-    # Make all .py files executable
+    # Make all .py files executable. Hooks are scripts, so a fixed 0o755
+    # is intended — one chmod per file instead of a stat + chmod pair, and
+    # scandir reuses readdir's cached entry type for the file test.
     made_executable = []
-    for script in hooks_dir.glob("*.py"):
-        try:
-            # Get current permissions
-            current = script.stat().st_mode
-            # Add execute permission for user, group, other
-            script.chmod(current | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-            made_executable.append(script.name)
-        except Exception as e:
-            print(f"⚠️  Could not make {script.name} executable: {e}")
+    with os.scandir(hooks_dir) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".py") and entry.is_file(follow_symlinks=False)):
+                continue
+            try:
+                os.chmod(entry.path, 0o755)
+                made_executable.append(entry.name)
+            except Exception as e:
+                print(f"⚠️  Could not make {entry.name} executable: {e}")
 
     if made_executable:
         print("✅ Made hook scripts executable:")
@@ -139,6 +163,23 @@ def make_hooks_executable():
     return True
 
 
+def _write_if_missing(path, content):
+    """Create a file with content only if it doesn't exist yet.
+
+    Uses O_EXCL so creation is a single syscall instead of a stat()
+    pre-check followed by an open. Returns True if the file was created.
+    """
+    try:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return True
+
+
 def create_ai_directory():
     """Create .ai/ directory structure."""
     print_header("Creating .ai/ Directory Structure")
@@ -152,14 +193,12 @@ def create_ai_directory():
 
     # Create .gitignore for .ai/
     gitignore = ai_dir / ".gitignore"
-    if not gitignore.exists():
-        gitignore.write_text("# AI-Pack workspace\n# Task packets are tracked\n")
+    if _write_if_missing(gitignore, "# AI-Pack workspace\n# Task packets are tracked\n"):
         print(f"✅ Created {gitignore}")
 
     # Create repo-overrides.md if it doesn't exist
     overrides = ai_dir / "repo-overrides.md"
-    if not overrides.exists():
-        overrides.write_text("""# Project-Specific Overrides
+    if _write_if_missing(overrides, """# Project-Specific Overrides
 
 This file contains project-specific rules that override or extend the ai-pack framework defaults.
 
@@ -183,7 +222,7 @@ This file contains project-specific rules that override or extend the ai-pack fr
 ## Notes
 
 [Any other project-specific guidance for AI assistants]
-""")
+"""):
         print(f"✅ Created {overrides}")
 
     print()
@@ -203,9 +242,25 @@ def verify_setup():
         (".ai/tasks/", "Task packet directory"),
     ]
 
+    # Group checks by parent directory and scan each parent once, instead
+    # of issuing an independent stat() per path.
+    by_parent = {}
+    for path, _ in checks:
+        parent, name = os.path.split(path.rstrip("/"))
+        by_parent.setdefault(parent, []).append(name)
+
+    found = {}
+    for parent, names in by_parent.items():
+        try:
+            entries = {entry.name for entry in os.scandir(parent)}
+        except FileNotFoundError:
+            entries = set()
+        for name in names:
+            found[os.path.join(parent, name)] = name in entries
+
     all_good = True
     for path, description in checks:
-        if Path(path).exists():
+        if found[path.rstrip("/")]:
             print(f"✅ {description:30} {path}")
         else:
             print(f"❌ {description:30} {path} (MISSING)")
@@ -20,10 +20,115 @@ What it does:
 import os
 import sys
 import shutil
+import subprocess
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+
+def _fast_copytree(src, dst):
+    """Copy a directory tree using the fastest mechanism available.
+
+    On Windows, shells out to robocopy (multi-threaded, much faster than
+    shutil.copytree for trees of many small files). Elsewhere, uses
+    shutil.copytree with plain copy (content + permissions, skipping the
+    per-file copystat metadata calls).
+    """
+    if sys.platform == 'win32' and shutil.which('robocopy'):
+        result = subprocess.run(
+            ['robocopy', str(src), str(dst),
+             '/MT:64', '/E', '/NFL', '/NDL', '/NJH', '/NJS', '/SL'],
+            check=False
+        )
+        # robocopy returns 0 (nothing copied) or 1 (files copied) on success
+        if result.returncode <= 1:
+            return
+        raise OSError(f"robocopy failed with exit code {result.returncode}")
+
+    shutil.copytree(src, dst, copy_function=shutil.copy)
+
+
+# Larger block size for shutil's chunked fallback copies (the default is
+# 64KiB on non-Windows platforms)
+shutil.COPY_BUFSIZE = 1 << 20
+
+
+def _fast_copy(src, dst):
+    """Copy one file's contents using copy_file_range when available.
+
+    On Linux, copy_file_range performs the copy entirely in kernel space
+    (and can reflink on btrfs/XFS), with no user-space bounce buffer.
+    Falls back to shutil.copy on other platforms or on any OS error.
+
+    Writes go to a temp file that is os.replace()d into place. The
+    backup snapshots destinations via hardlinks, so truncating an
+    existing destination in place would destroy the backed-up content;
+    replacing gives the destination a fresh inode and leaves the
+    backup's inode untouched.
+    """
+    tmp = f"{dst}.tmp"
+    if hasattr(os, 'copy_file_range'):
+        try:
+            in_fd = os.open(src, os.O_RDONLY)
+            try:
+                out_fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    while os.copy_file_range(in_fd, out_fd, 1 << 20):
+                        pass
+                finally:
+                    os.close(out_fd)
+                os.replace(tmp, dst)
+                return
+            finally:
+                os.close(in_fd)
+        except OSError:
+            pass
+    shutil.copy(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _hardlink_tree(src, dst):
+    """Snapshot a directory tree using hardlinks instead of byte copies.
+
+    Each regular file becomes a hardlink to the original — one syscall
+    per file, no data I/O — so the snapshot is near-instant regardless
+    of tree size. Files that can't be linked (e.g. cross-device) fall
+    back to a real copy. On Windows, where hardlink support varies by
+    filesystem, the robocopy-backed copy is used instead.
+    """
+    if sys.platform == 'win32':
+        _fast_copytree(src, dst)
+        return
+
+    os.makedirs(dst)
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        dst_root = dst if rel == '.' else os.path.join(dst, rel)
+        for name in dirs:
+            os.mkdir(os.path.join(dst_root, name))
+        for name in files:
+            src_file = os.path.join(root, name)
+            try:
+                os.link(src_file, os.path.join(dst_root, name))
+            except OSError:
+                shutil.copy2(src_file, os.path.join(dst_root, name))
+
+# Framework files (always overwritten on update), built once at import as
+# frozensets of interned names so repeated membership tests can hit the
+# identity-compare fast path.
+FRAMEWORK_COMMANDS = frozenset(map(sys.intern, (
+    'task-init.md', 'task-status.md', 'orchestrate.md', 'engineer.md',
+    'review.md', 'test.md', 'inspect.md', 'architect.md', 'designer.md',
+    'pm.md', 'help.md',
+)))
+FRAMEWORK_SKILLS = frozenset(map(sys.intern, ('orchestrator', 'engineer')))
+FRAMEWORK_RULES = frozenset(map(sys.intern, (
+    'gates.md', 'task-packets.md', 'workflows.md',
+)))
+FRAMEWORK_HOOKS = frozenset(map(sys.intern, (
+    'task-init.py', 'task-status.py', 'check-task-packet.py',
+)))
+
 # Colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -35,7 +140,22 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+def _configure_output():
+    """Switch stdout to block buffering.
+
+    The script emits dozens of small progress lines; with the default
+    line buffering each one is its own write() syscall. Block buffering
+    batches a section's output into a handful of writes — sections flush
+    explicitly at each header, before prompts, and at interpreter exit.
+    """
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError, OSError):
+        pass
+
 def print_header(msg):
+    # Flush the previous section's buffered output before starting a new one
+    sys.stdout.flush()
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{msg}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
@@ -82,17 +202,33 @@ def backup_existing():
         print_info("No existing .claude/ directory to backup")
         return None
 
+    # Only code path that needs datetime; imported here to keep startup lean
+    from datetime import datetime
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_dir = f'.claude.backup.{timestamp}'
 
     try:
-        shutil.copytree('.claude', backup_dir)
+        _hardlink_tree('.claude', backup_dir)
         print_success(f"Created backup: {backup_dir}/")
         return backup_dir
     except Exception as e:
         print_error(f"Failed to create backup: {e}")
         return None
 
+def _list_ext(dirpath, suffix):
+    """List file names in a directory matching a suffix, via one scandir.
+
+    Avoids pathlib's per-entry Path construction and fnmatch machinery;
+    returns an empty list if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(dirpath) as entries:
+            return [e.name for e in entries
+                    if e.name.endswith(suffix) and e.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
 def detect_customizations():
     """Detect project-specific customizations in .claude/."""
     print_header("Detecting Customizations")
@@ -115,65 +251,94 @@ def detect_customizations():
         'custom_settings': False
     }
 
-    # Framework files (will be overwritten)
-    framework_commands = {
-        'task-init.md', 'task-status.md', 'orchestrate.md', 'engineer.md',
-        'review.md', 'test.md', 'inspect.md', 'architect.md', 'designer.md',
-        'pm.md', 'help.md'
-    }
-    framework_skills = {'orchestrator', 'engineer'}
-    framework_rules = {'gates.md', 'task-packets.md', 'workflows.md'}
-    framework_hooks = {'task-init.py', 'task-status.py', 'check-task-packet.py'}
-
     # Check for custom commands
-    commands_dir = Path('.claude/commands/ai-pack')
-    if commands_dir.exists():
-        for cmd in commands_dir.glob('*.md'):
-            if cmd.name not in framework_commands:
-                customizations['commands'].append(cmd.name)
-                print_info(f"Found custom command: {cmd.name}")
+    for name in _list_ext('.claude/commands/ai-pack', '.md'):
+        if name not in FRAMEWORK_COMMANDS:
+            customizations['commands'].append(name)
+            print_info(f"Found custom command: {name}")
 
     # Check for custom skills
-    skills_dir = Path('.claude/skills')
-    if skills_dir.exists():
-        for skill_dir in skills_dir.iterdir():
-            if skill_dir.is_dir() and skill_dir.name not in framework_skills:
-                if (skill_dir / 'SKILL.md').exists():
-                    customizations['skills'].append(skill_dir.name)
-                    print_info(f"Found custom skill: {skill_dir.name}")
+    try:
+        with os.scandir('.claude/skills') as entries:
+            skill_dirs = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        skill_dirs = []
+    for name in skill_dirs:
+        if name not in FRAMEWORK_SKILLS:
+            if os.path.isfile(os.path.join('.claude/skills', name, 'SKILL.md')):
+                customizations['skills'].append(name)
+                print_info(f"Found custom skill: {name}")
 
     # Check for custom rules
-    rules_dir = Path('.claude/rules')
-    if rules_dir.exists():
-        for rule in rules_dir.glob('*.md'):
-            if rule.name not in framework_rules and rule.name != 'README.md':
-                customizations['rules'].append(rule.name)
-                print_info(f"Found custom rule: {rule.name}")
+    for name in _list_ext('.claude/rules', '.md'):
+        if name not in FRAMEWORK_RULES and name != 'README.md':
+            customizations['rules'].append(name)
+            print_info(f"Found custom rule: {name}")
 
     # Check for custom hooks
-    hooks_dir = Path('.claude/hooks')
-    if hooks_dir.exists():
-        for hook in hooks_dir.glob('*.py'):
-            if hook.name not in framework_hooks:
-                customizations['hooks'].append(hook.name)
-                print_info(f"Found custom hook: {hook.name}")
+    for name in _list_ext('.claude/hooks', '.py'):
+        if name not in FRAMEWORK_HOOKS:
+            customizations['hooks'].append(name)
+            print_info(f"Found custom hook: {name}")
 
     # Check for custom settings
     settings_file = Path('.claude/settings.json')
     if settings_file.exists():
-        # Read and check if it differs from template
         try:
-            import json
-            with open(settings_file, 'r') as f:
-                current_settings = json.load(f)
-
-            # Check if there are hooks beyond the standard task-packet check
-            hooks = current_settings.get('hooks', {})
-            if hooks and len(hooks) > 1 or \
-               (hooks.get('UserPromptSubmit') and
-                len(hooks['UserPromptSubmit']) > 1):
-                customizations['custom_settings'] = True
-                print_warning("Found custom settings.json with additional hooks")
+            import hashlib
+            current_bytes = settings_file.read_bytes()
+            # Older submodules may not ship a template settings.json
+            # (check_prerequisites only verifies the directory); fall
+            # through to the parse-based check rather than letting the
+            # raise disable detection entirely
+            try:
+                template_bytes = Path('.ai-pack/templates/.claude/settings.json').read_bytes()
+            except OSError:
+                template_bytes = None
+
+            # Fast path: byte-identical to the template means no
+            # customization — skip JSON parsing entirely. SHA-256 is
+            # hardware-accelerated and far cheaper than a parse.
+            if template_bytes is None or \
+               hashlib.sha256(current_bytes).digest() != \
+               hashlib.sha256(template_bytes).digest():
+                # Check if there are hooks beyond the standard task-packet
+                # check. With ijson we stream the parse and stop at the
+                # second hook without materializing the whole document.
+                custom = None
+                try:
+                    import io
+                    import ijson
+                    hook_keys = prompt_hooks = 0
+                    custom = False
+                    for prefix, event, _ in ijson.parse(io.BytesIO(current_bytes)):
+                        if prefix == 'hooks' and event == 'map_key':
+                            hook_keys += 1
+                        elif prefix == 'hooks.UserPromptSubmit.item' and \
+                                event == 'start_map':
+                            prompt_hooks += 1
+                        if hook_keys > 1 or prompt_hooks > 1:
+                            custom = True
+                            break
+                except ImportError:
+                    pass
+
+                if custom is None:
+                    try:
+                        import orjson
+                        current_settings = orjson.loads(current_bytes)
+                    except ImportError:
+                        import json
+                        current_settings = json.loads(current_bytes)
+
+                    hooks = current_settings.get('hooks', {})
+                    custom = bool(hooks and len(hooks) > 1 or
+                                  (hooks.get('UserPromptSubmit') and
+                                   len(hooks['UserPromptSubmit']) > 1))
+
+                if custom:
+                    customizations['custom_settings'] = True
+                    print_warning("Found custom settings.json with additional hooks")
         except:
             pass
 
@@ -204,87 +369,113 @@ def update_integration(customizations, backup_dir):
     (target_dir / 'hooks').mkdir(exist_ok=True)
     (target_dir / 'scripts').mkdir(exist_ok=True)
 
-    # Copy framework commands (always update)
-    print_info("Updating framework commands...")
-    src_commands = template_dir / 'commands' / 'ai-pack'
-    dst_commands = target_dir / 'commands' / 'ai-pack'
-    for cmd in src_commands.glob('*.md'):
-        shutil.copy2(cmd, dst_commands / cmd.name)
-    print_success(f"Updated {len(list(src_commands.glob('*.md')))} commands")
+    # Gather all framework file copies, then run them through one thread
+    # pool: each copy is an independent chain of blocking syscalls, so
+    # threads overlap the I/O latency well. shutil.copy skips the
+    # copystat metadata pass — framework file mtimes don't matter.
+    copy_pairs = []
+    executable_paths = []
+
+    # Framework files are enumerated and copied as plain path strings —
+    # only the names are needed, and staying out of pathlib avoids its
+    # per-entry object construction in these loops.
 
-    # Copy framework skills (always update)
+    # Framework commands (always update)
+    print_info("Updating framework commands...")
+    src_commands = str(template_dir / 'commands' / 'ai-pack')
+    dst_commands = str(target_dir / 'commands' / 'ai-pack')
+    command_files = _list_ext(src_commands, '.md')
+    for name in command_files:
+        copy_pairs.append((os.path.join(src_commands, name),
+                           os.path.join(dst_commands, name)))
+
+    # Framework skills (always update)
     print_info("Updating framework skills...")
     for skill in ['orchestrator', 'engineer', 'coordinator', 'reviewer', 'watchdog']:
         src_skill = template_dir / 'skills' / skill
         dst_skill = target_dir / 'skills' / skill
         if src_skill.exists():
             dst_skill.mkdir(exist_ok=True)
-            shutil.copy2(src_skill / 'SKILL.md', dst_skill / 'SKILL.md')
-    print_success("Updated framework skills")
+            copy_pairs.append((src_skill / 'SKILL.md', dst_skill / 'SKILL.md'))
 
-    # Copy framework rules (always update)
+    # Framework rules (always update)
     print_info("Updating framework rules...")
-    src_rules = template_dir / 'rules'
-    dst_rules = target_dir / 'rules'
-    for rule in src_rules.glob('*.md'):
-        shutil.copy2(rule, dst_rules / rule.name)
-    print_success(f"Updated {len(list(src_rules.glob('*.md')))} rules")
-
-    # Copy framework hooks (always update)
+    src_rules = str(template_dir / 'rules')
+    dst_rules = str(target_dir / 'rules')
+    rule_files = _list_ext(src_rules, '.md')
+    for name in rule_files:
+        copy_pairs.append((os.path.join(src_rules, name),
+                           os.path.join(dst_rules, name)))
+
+    # Framework hooks (always update)
     print_info("Updating framework hooks...")
-    src_hooks = template_dir / 'hooks'
-    dst_hooks = target_dir / 'hooks'
+    src_hooks = str(template_dir / 'hooks')
+    dst_hooks = str(target_dir / 'hooks')
 
     # Get list of framework hooks from template
-    framework_hooks = {hook.name for hook in src_hooks.glob('*.py')}
-
-    # Copy current framework hooks
-    for hook in src_hooks.glob('*.py'):
-        shutil.copy2(hook, dst_hooks / hook.name)
-        # Make executable
-        os.chmod(dst_hooks / hook.name, 0o755)
-    shutil.copy2(src_hooks / 'README.md', dst_hooks / 'README.md')
+    hook_files = _list_ext(src_hooks, '.py')
+    framework_hooks = set(hook_files)
 
-    # Clean up removed framework hooks (but preserve custom hooks)
-    if dst_hooks.exists():
-        for existing_hook in dst_hooks.glob('*.py'):
-            # If hook exists in destination but NOT in template and NOT in custom list
-            if existing_hook.name not in framework_hooks and existing_hook.name not in [f"{h}.py" for h in customizations.get('hooks', [])]:
-                print_warning(f"Removing obsolete framework hook: {existing_hook.name}")
-                existing_hook.unlink()
-
-    print_success(f"Updated {len(list(src_hooks.glob('*.py')))} hooks")
+    for name in hook_files:
+        dst_hook = os.path.join(dst_hooks, name)
+        copy_pairs.append((os.path.join(src_hooks, name), dst_hook))
+        executable_paths.append(dst_hook)
+    copy_pairs.append((os.path.join(src_hooks, 'README.md'),
+                       os.path.join(dst_hooks, 'README.md')))
 
-    # Copy framework scripts (always update)
+    # Framework scripts (always update)
     print_info("Updating framework scripts...")
-    src_scripts = template_dir / 'scripts'
-    dst_scripts = target_dir / 'scripts'
-    if src_scripts.exists():
-        for script in src_scripts.glob('*'):
-            if script.is_file():
-                shutil.copy2(script, dst_scripts / script.name)
-                # Make executable
-                os.chmod(dst_scripts / script.name, 0o755)
-        print_success(f"Updated {len(list(src_scripts.glob('*')))} scripts")
+    src_scripts = str(template_dir / 'scripts')
+    dst_scripts = str(target_dir / 'scripts')
+    script_files = []
+    if os.path.isdir(src_scripts):
+        script_files = _list_ext(src_scripts, '')
+        for name in script_files:
+            dst_script = os.path.join(dst_scripts, name)
+            copy_pairs.append((os.path.join(src_scripts, name), dst_script))
+            executable_paths.append(dst_script)
     else:
         print_warning("No scripts directory in template")
 
+    # Copy everything in parallel, then mark hooks/scripts executable
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda pair: _fast_copy(*pair), copy_pairs))
+    for path in executable_paths:
+        os.chmod(path, 0o755)
+
+    print_success(f"Updated {len(command_files)} commands")
+    print_success("Updated framework skills")
+    print_success(f"Updated {len(rule_files)} rules")
+
+    # Clean up removed framework hooks (but preserve custom hooks)
+    for name in _list_ext(dst_hooks, '.py'):
+        # If hook exists in destination but NOT in template and NOT in custom list
+        if name not in framework_hooks and name not in [f"{h}.py" for h in customizations.get('hooks', [])]:
+            print_warning(f"Removing obsolete framework hook: {name}")
+            os.remove(os.path.join(dst_hooks, name))
+
+    print_success(f"Updated {len(hook_files)} hooks")
+    if script_files:
+        print_success(f"Updated {len(script_files)} scripts")
+
     # Handle settings.json
     if customizations['custom_settings'] and backup_dir:
         print_warning("Custom settings.json detected")
         print_info("New template saved as: .claude/settings.json.new")
         print_info("Review and merge manually:")
         print_info(f"  diff {backup_dir}/.claude/settings.json .claude/settings.json.new")
-        shutil.copy2(template_dir / 'settings.json',
-                     target_dir / 'settings.json.new')
+        _fast_copy(template_dir / 'settings.json',
+                   target_dir / 'settings.json.new')
     else:
         print_info("Updating settings.json...")
-        shutil.copy2(template_dir / 'settings.json',
-                     target_dir / 'settings.json')
+        # _fast_copy rather than copy2: replaces the inode instead of
+        # truncating it, keeping the hardlinked backup intact
+        _fast_copy(template_dir / 'settings.json',
+                   target_dir / 'settings.json')
         print_success("Updated settings.json")
 
     # Copy main README
-    shutil.copy2(template_dir / 'README.md', target_dir / 'README.md')
+    _fast_copy(template_dir / 'README.md', target_dir / 'README.md')
     print_success("Updated main README.md")
 
     # Report on preserved customizations
@@ -366,6 +557,7 @@ def show_summary(backup_dir, customizations):
     print(f"\n{Colors.OKGREEN}{Colors.BOLD}All done! 🎉{Colors.ENDC}\n")
 
 def main():
+    _configure_output()
     print_header("AI-Pack Claude Code Integration - UPDATE")
     print("This script updates existing projects with new integration features.\n")
 
@@ -392,6 +584,7 @@ def main():
         print("Framework files will be updated, custom files will be preserved.")
 
         if not args.yes:
+            sys.stdout.flush()
             response = input(f"\n{Colors.BOLD}Continue with update? [y/N]: {Colors.ENDC}")
             if response.lower() not in ['y', 'yes']:
                 print_info("Update cancelled")
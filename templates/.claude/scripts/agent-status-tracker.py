@@ -5,58 +5,225 @@ Tracks completion status of agents and generates reports for Orchestrator.
 """
 
 import os
-import json
 import sys
-from pathlib import Path
-from datetime import datetime
+
+# orjson (C-level, SIMD-accelerated) serializes and parses several times
+# faster than the stdlib — especially for indented output, which stdlib
+# json pretty-prints in pure Python. Fall back to the stdlib when it
+# isn't installed.
+try:
+    import orjson
+
+    def _dumps(obj):
+        """Serialize to pretty-printed JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj):
+        """Serialize one compact JSON line (no trailing newline)."""
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+    # Zero-copy view over mmapped bytes; orjson parses it in place
+    _view = memoryview
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _dumps_line(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+    # stdlib json only takes real str/bytes; the copy still reads
+    # straight out of the kernel page cache
+    _view = bytes
 
 STATUS_FILE = ".claude/.agent-status.json"
+JOURNAL_FILE = ".claude/.agent-status.jsonl"
+SOCKET_FILE = ".claude/.agent-status.sock"
+
+# Idle window after which the daemon folds journaled events into a snapshot
+DAEMON_FLUSH_SECS = 5.0
+
+STATUS_ICONS = {
+    "active": "🟢",
+    "completed": "✅",
+    "blocked": "🔴"
+}
+
+def _now():
+    """Current time as an ISO string.
+
+    datetime is imported at first use so read-only invocations (usage
+    text, report on an empty tracker) skip the import entirely.
+    """
+    from datetime import datetime
+    return datetime.now().isoformat()
+
+
+def _empty_status_index():
+    return {"active": [], "completed": [], "blocked": []}
+
+def _index_move(data, agent_id, old_status, new_status):
+    """Keep the status index in step with one agent's status change."""
+    if old_status == new_status:
+        return
+    index = data["status_index"]
+    if old_status is not None:
+        bucket = index.get(old_status)
+        if bucket is not None and agent_id in bucket:
+            bucket.remove(agent_id)
+    bucket = index.setdefault(new_status, [])
+    if agent_id not in bucket:
+        bucket.append(agent_id)
+
+# Journaled events folded into a fresh snapshot once this many accumulate
+SNAPSHOT_EVERY = 50
 
 class AgentStatusTracker:
     def __init__(self):
-        self.status_file = Path(STATUS_FILE)
-        self.status_file.parent.mkdir(parents=True, exist_ok=True)
+        self.status_file = STATUS_FILE
+        self.journal_file = JOURNAL_FILE
+        # An unconditional mkdir is a syscall per CLI invocation even when
+        # the directory already exists (the common case); probe first
+        parent = os.path.dirname(STATUS_FILE)
+        if not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
         self.data = self.load()
 
     def load(self):
-        """Load existing status data."""
-        if self.status_file.exists():
+        """Load the last snapshot, then replay any journaled events."""
+        data = self.default_data()
+        if os.path.exists(self.status_file):
+            # Map the snapshot instead of read()ing it: no userspace copy
+            # of the whole file, and the pages stay kernel-cached across
+            # the CLI invocations each hook call spawns
+            import mmap
+            try:
+                with open(self.status_file, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size:
+                        with mmap.mmap(f.fileno(), size,
+                                       access=mmap.ACCESS_READ) as m:
+                            data = _loads(_view(m))
+            except (ValueError, OSError):
+                # Corrupt or unreadable snapshot: start from defaults.
+                # ValueError covers both stdlib json and orjson decode
+                # errors; anything else should surface, not be swallowed
+                pass
+
+        # Migrate snapshots written before the index existed, before any
+        # journal replay tries to keep the index current
+        if "status_index" not in data:
+            index = _empty_status_index()
+            for agent_id, agent in data["agents"].items():
+                index.setdefault(agent["status"], []).append(agent_id)
+            data["status_index"] = index
+
+        self._journal_events = 0
+        if os.path.exists(self.journal_file):
             try:
-                with open(self.status_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return self.default_data()
-        return self.default_data()
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        self._apply_event(data, _loads(line))
+                        self._journal_events += 1
+            except (ValueError, KeyError, OSError):
+                # Truncated tail or malformed event: keep what replayed
+                pass
+
+        return data
 
     def default_data(self):
         """Return default status structure."""
         return {
             "agents": {},
+            "status_index": _empty_status_index(),
             "last_update": None,
             "orchestrator_id": None
         }
 
-    def save(self):
-        """Save status data."""
-        with open(self.status_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+    @staticmethod
+    def _apply_event(data, event):
+        """Replay one journaled event onto a status dict."""
+        op = event.get("op")
+        if op == "register":
+            old = data["agents"].get(event["agent"])
+            data["agents"][event["agent"]] = event["record"]
+            data["orchestrator_id"] = event["orchestrator_id"]
+            _index_move(data, event["agent"], old["status"] if old else None,
+                        event["record"]["status"])
+        elif op == "update":
+            agent = data["agents"].get(event["agent"])
+            if agent is not None:
+                old_status = agent["status"]
+                agent.update(event["fields"])
+                _index_move(data, event["agent"], old_status, agent["status"])
+        elif op == "blocked":
+            agent = data["agents"].get(event["agent"])
+            if agent is not None:
+                _index_move(data, event["agent"], agent["status"], "blocked")
+                agent["status"] = "blocked"
+                agent["blockers"].append(event["blocker"])
+                agent["last_update"] = event["ts"]
+        if "ts" in event:
+            data["last_update"] = event["ts"]
+
+    def save(self, event=None):
+        """Persist one journaled event, or snapshot the full state.
+
+        Appending a single event line costs O(event) instead of
+        re-serializing every agent on each update; the journal is folded
+        into a snapshot every SNAPSHOT_EVERY events and on report.
+        """
+        if event is None:
+            self.snapshot()
+            return
+
+        with open(self.journal_file, 'ab') as f:
+            f.write(_dumps_line(event) + b"\n")
+        self._journal_events += 1
+        if self._journal_events >= SNAPSHOT_EVERY:
+            self.snapshot()
+
+    def snapshot(self):
+        """Write the full state atomically and truncate the journal."""
+        tmp = self.status_file + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(self.data))
+        os.replace(tmp, self.status_file)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_events = 0
 
     def register_agent(self, agent_id, role, task, orchestrator_id):
         """Register a new agent."""
-        self.data["agents"][agent_id] = {
+        # One timestamp per update: the fields are meant to show the same
+        # instant, and this avoids repeated datetime.now().isoformat() calls
+        now = _now()
+        record = {
             "role": role,
             "task": task,
             "status": "active",
-            "started": datetime.now().isoformat(),
-            "last_update": datetime.now().isoformat(),
+            "started": now,
+            "last_update": now,
             "completed": None,
             "work_log": None,
             "commits": 0,
             "blockers": []
         }
+        # Re-registration must vacate the old status bucket, so look up
+        # any existing record before overwriting it
+        old = self.data["agents"].get(agent_id)
+        self.data["agents"][agent_id] = record
+        _index_move(self.data, agent_id, old["status"] if old else None, "active")
         self.data["orchestrator_id"] = orchestrator_id
-        self.data["last_update"] = datetime.now().isoformat()
-        self.save()
+        self.data["last_update"] = now
+        self.save({"op": "register", "agent": agent_id, "record": record,
+                   "orchestrator_id": orchestrator_id, "ts": now})
         print(f"Registered agent: {agent_id} ({role})")
 
     def update_agent(self, agent_id, **kwargs):
@@ -65,12 +232,16 @@ class AgentStatusTracker:
             print(f"Warning: Agent {agent_id} not registered")
             return
 
+        now = _now()
+        fields = dict(kwargs)
+        fields["last_update"] = now
         agent = self.data["agents"][agent_id]
-        for key, value in kwargs.items():
-            agent[key] = value
-        agent["last_update"] = datetime.now().isoformat()
-        self.data["last_update"] = datetime.now().isoformat()
-        self.save()
+        old_status = agent["status"]
+        agent.update(fields)
+        _index_move(self.data, agent_id, old_status, agent["status"])
+        self.data["last_update"] = now
+        self.save({"op": "update", "agent": agent_id, "fields": fields,
+                   "ts": now})
         print(f"Updated agent: {agent_id} - {kwargs}")
 
     def mark_complete(self, agent_id):
@@ -78,7 +249,7 @@ class AgentStatusTracker:
         self.update_agent(
             agent_id,
             status="completed",
-            completed=datetime.now().isoformat()
+            completed=_now()
         )
 
     def mark_blocked(self, agent_id, blocker):
@@ -86,17 +257,26 @@ class AgentStatusTracker:
         if agent_id not in self.data["agents"]:
             return
 
+        now = _now()
+        entry = {
+            "blocker": blocker,
+            "timestamp": now
+        }
         agent = self.data["agents"][agent_id]
+        _index_move(self.data, agent_id, agent["status"], "blocked")
         agent["status"] = "blocked"
-        agent["blockers"].append({
-            "blocker": blocker,
-            "timestamp": datetime.now().isoformat()
-        })
-        agent["last_update"] = datetime.now().isoformat()
-        self.save()
+        agent["blockers"].append(entry)
+        agent["last_update"] = now
+        self.data["last_update"] = now
+        self.save({"op": "blocked", "agent": agent_id, "blocker": entry,
+                   "ts": now})
 
     def generate_report(self):
         """Generate status report for Orchestrator."""
+        # Fold any journaled events into a fresh snapshot at report time
+        if self._journal_events:
+            self.snapshot()
+
         agents = self.data["agents"]
 
         if not agents:
@@ -108,95 +288,191 @@ class AgentStatusTracker:
                 "agents": []
             }
 
-        active = [a for a in agents.values() if a["status"] == "active"]
-        completed = [a for a in agents.values() if a["status"] == "completed"]
-        blocked = [a for a in agents.values() if a["status"] == "blocked"]
+        # Status totals come straight from the incrementally-maintained
+        # index; only the detail list still needs a pass over the agents
+        index = self.data["status_index"]
+        active = len(index.get("active", ()))
+        completed = len(index.get("completed", ()))
+        blocked = len(index.get("blocked", ()))
+
+        details = []
+        for agent_id, agent in agents.items():
+            details.append({
+                "id": agent_id,
+                "role": agent["role"],
+                "task": agent["task"],
+                "status": agent["status"],
+                "commits": agent["commits"],
+                "blockers": agent["blockers"]
+            })
 
         return {
-            "summary": f"{len(completed)}/{len(agents)} completed, {len(active)} active, {len(blocked)} blocked",
-            "active_count": len(active),
-            "completed_count": len(completed),
-            "blocked_count": len(blocked),
+            "summary": f"{completed}/{len(agents)} completed, {active} active, {blocked} blocked",
+            "active_count": active,
+            "completed_count": completed,
+            "blocked_count": blocked,
             "total_count": len(agents),
-            "agents": [
-                {
-                    "id": agent_id,
-                    "role": agent["role"],
-                    "task": agent["task"],
-                    "status": agent["status"],
-                    "commits": agent["commits"],
-                    "blockers": agent["blockers"]
-                }
-                for agent_id, agent in agents.items()
-            ]
+            "agents": details
         }
 
+def _send_to_daemon(command, argv):
+    """Send one command to a running daemon; return its output, or None.
+
+    Returns None when no daemon is reachable (no Unix-socket support, no
+    socket file, stale socket) so the caller can fall back to the normal
+    load-mutate-save path.
+    """
+    import socket
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(SOCKET_FILE):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(SOCKET_FILE)
+            client.sendall(_dumps_line({"command": command, "argv": argv}) + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8")
+    except OSError:
+        return None
+
+def _cmd_daemon(tracker, argv):
+    """Serve tracker commands over a Unix socket with state held in memory.
+
+    Each CLI invocation normally re-reads and re-parses the status file;
+    with the daemon running, commands are one socket round-trip against
+    the resident dict. Journaled events are folded into a snapshot
+    whenever the daemon sits idle and on shutdown.
+    """
+    import io
+    import socket
+    from contextlib import redirect_stdout
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Daemon mode requires Unix domain sockets")
+        sys.exit(1)
+
+    try:
+        os.unlink(SOCKET_FILE)
+    except OSError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(SOCKET_FILE)
+        server.listen()
+        server.settimeout(DAEMON_FLUSH_SECS)
+        print(f"Agent status daemon listening on {SOCKET_FILE}")
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    if tracker._journal_events:
+                        tracker.snapshot()
+                    continue
+                with conn:
+                    try:
+                        request = _loads(conn.makefile("rb").readline())
+                        handler = COMMANDS.get(request.get("command"))
+                        out = io.StringIO()
+                        if handler is None or handler is _cmd_daemon:
+                            out.write(f"Unknown command: {request.get('command')}\n")
+                        else:
+                            with redirect_stdout(out):
+                                handler(tracker, request.get("argv", []))
+                        conn.sendall(out.getvalue().encode("utf-8"))
+                    except Exception as e:
+                        conn.sendall(f"Error: {e}\n".encode("utf-8"))
+        finally:
+            tracker.snapshot()
+            try:
+                os.unlink(SOCKET_FILE)
+            except OSError:
+                pass
+
+def _cmd_register(tracker, argv):
+    agent_id, role, task, orchestrator_id = argv[:4]
+    tracker.register_agent(agent_id, role, task, orchestrator_id)
+
+def _cmd_update(tracker, argv):
+    agent_id = argv[0]
+    updates = {}
+    for arg in argv[1:]:
+        if "=" in arg:
+            key, value = arg.split("=", 1)
+            # isdecimal pre-check keeps the common non-numeric case off
+            # the exception path (raising allocates a traceback per miss).
+            # At most one leading sign, and isdecimal rather than isdigit:
+            # both reject values like "--2" or "²" that int() can't parse
+            digits = value[1:] if value.startswith("-") else value
+            if digits.isdecimal():
+                value = int(value)
+            updates[key] = value
+    tracker.update_agent(agent_id, **updates)
+
+def _cmd_complete(tracker, argv):
+    tracker.mark_complete(argv[0])
+
+def _cmd_blocked(tracker, argv):
+    tracker.mark_blocked(argv[0], " ".join(argv[1:]))
+
+def _cmd_report(tracker, argv):
+    report = tracker.generate_report()
+    print("\n" + "="*60)
+    print("AGENT STATUS REPORT")
+    print("="*60)
+    print(f"Summary: {report['summary']}")
+    print(f"Active: {report['active_count']}")
+    print(f"Completed: {report['completed_count']}")
+    print(f"Blocked: {report['blocked_count']}")
+    print("\nAgent Details:")
+    for agent in report['agents']:
+        status_icon = STATUS_ICONS.get(agent['status'], "⚪")
+        print(f"\n  {status_icon} {agent['id']} ({agent['role']})")
+        print(f"     Task: {agent['task']}")
+        print(f"     Status: {agent['status']}")
+        print(f"     Commits: {agent['commits']}")
+        if agent['blockers']:
+            print(f"     Blockers: {len(agent['blockers'])}")
+            for blocker in agent['blockers']:
+                print(f"       - {blocker['blocker']}")
+    print("="*60 + "\n")
+
+# O(1) command dispatch instead of a chain of string comparisons
+COMMANDS = {
+    "register": _cmd_register,
+    "update": _cmd_update,
+    "complete": _cmd_complete,
+    "blocked": _cmd_blocked,
+    "report": _cmd_report,
+    "daemon": _cmd_daemon,
+}
+
 def main():
     """Main CLI interface."""
-    if len(sys.argv) < 2:
+    handler = COMMANDS.get(sys.argv[1]) if len(sys.argv) > 1 else None
+    if handler is None:
         print("Usage:")
         print("  python3 agent-status-tracker.py register <agent_id> <role> <task> <orchestrator_id>")
         print("  python3 agent-status-tracker.py update <agent_id> <key=value> ...")
         print("  python3 agent-status-tracker.py complete <agent_id>")
         print("  python3 agent-status-tracker.py blocked <agent_id> <blocker>")
         print("  python3 agent-status-tracker.py report")
+        print("  python3 agent-status-tracker.py daemon")
         sys.exit(1)
 
-    tracker = AgentStatusTracker()
-    command = sys.argv[1]
-
-    if command == "register":
-        agent_id, role, task, orchestrator_id = sys.argv[2:6]
-        tracker.register_agent(agent_id, role, task, orchestrator_id)
+    # Prefer a running daemon (in-memory state, no per-command JSON reload)
+    if handler is not _cmd_daemon:
+        output = _send_to_daemon(sys.argv[1], sys.argv[2:])
+        if output is not None:
+            sys.stdout.write(output)
+            return
 
-    elif command == "update":
-        agent_id = sys.argv[2]
-        updates = {}
-        for arg in sys.argv[3:]:
-            if "=" in arg:
-                key, value = arg.split("=", 1)
-                # Try to parse as int
-                try:
-                    value = int(value)
-                except:
-                    pass
-                updates[key] = value
-        tracker.update_agent(agent_id, **updates)
-
-    elif command == "complete":
-        agent_id = sys.argv[2]
-        tracker.mark_complete(agent_id)
-
-    elif command == "blocked":
-        agent_id = sys.argv[2]
-        blocker = " ".join(sys.argv[3:])
-        tracker.mark_blocked(agent_id, blocker)
-
-    elif command == "report":
-        report = tracker.generate_report()
-        print("\n" + "="*60)
-        print("AGENT STATUS REPORT")
-        print("="*60)
-        print(f"Summary: {report['summary']}")
-        print(f"Active: {report['active_count']}")
-        print(f"Completed: {report['completed_count']}")
-        print(f"Blocked: {report['blocked_count']}")
-        print("\nAgent Details:")
-        for agent in report['agents']:
-            status_icon = {
-                "active": "🟢",
-                "completed": "✅",
-                "blocked": "🔴"
-            }.get(agent['status'], "⚪")
-            print(f"\n  {status_icon} {agent['id']} ({agent['role']})")
-            print(f"     Task: {agent['task']}")
-            print(f"     Status: {agent['status']}")
-            print(f"     Commits: {agent['commits']}")
-            if agent['blockers']:
-                print(f"     Blockers: {len(agent['blockers'])}")
-                for blocker in agent['blockers']:
-                    print(f"       - {blocker['blocker']}")
-        print("="*60 + "\n")
+    handler(AgentStatusTracker(), sys.argv[2:])
 
 if __name__ == "__main__":
     main()
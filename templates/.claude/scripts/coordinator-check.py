@@ -8,10 +8,21 @@ Cross-platform Python implementation.
 """
 
 import os
+import re
 import glob
 from datetime import datetime
 from pathlib import Path
 
+# Role markers that indicate agent activity in a work log, compiled once
+# so each log is scanned in a single pass instead of one substring search
+# per marker.
+_ROLE_RE = re.compile(r'Engineer Role|Reviewer Role|Tester Role|Coordinator Role')
+
+# Headline words that mark a progress entry. Matching case-insensitively
+# in the regex engine avoids lowercasing each scanned line (which was
+# re-evaluated per word in the old any(...) form).
+_PROGRESS_RE = re.compile(r'progress|complete|status|update', re.IGNORECASE)
+
 def check_agent_progress():
     """Check all agent work logs and report status."""
 
@@ -33,7 +44,7 @@ def check_agent_progress():
 
             # Check if this work log has agent activity
             # Look for role markers: Engineer Role, Reviewer Role, Tester Role
-            if any(role in content for role in ['Engineer Role', 'Reviewer Role', 'Tester Role', 'Coordinator Role']):
+            if _ROLE_RE.search(content):
                 agents_found = True
 
                 # Extract task name from path
@@ -62,7 +73,7 @@ def check_agent_progress():
                 lines = content.split('\n')
                 recent_progress = "Working..."
                 for line in reversed(lines[-50:]):  # Check last 50 lines
-                    if line.startswith('###') and any(word in line.lower() for word in ['progress', 'complete', 'status', 'update']):
+                    if line.startswith('###') and _PROGRESS_RE.search(line):
                         recent_progress = line.replace('###', '').strip()
                         break
 